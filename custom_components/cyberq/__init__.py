@@ -34,7 +34,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC, DeviceInfo
 
-from .const import DOMAIN
+from .const import DOMAIN, HTTP_HEADERS
 from .coordinator import CyberqDataUpdateCoordinator
 from .cyberq import CyberqDevice
 
@@ -62,11 +62,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: CyberqConfigEntry) -> bo
             host=entry.data[CONF_HOST],
             port=entry.data[CONF_PORT],
             session=async_get_clientsession(hass),
+            headers=HTTP_HEADERS,
         ),
     )
     await coordinator.async_config_entry_first_refresh()
     entry.runtime_data = coordinator
 
+    coordinator.device_name = coordinator.cyberq.name
     coordinator.device_info = DeviceInfo(
         configuration_url=f"http://{coordinator.cyberq.host}/",
         identifiers={(DOMAIN, coordinator.cyberq.serial_number)},
@@ -74,7 +76,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: CyberqConfigEntry) -> bo
         serial_number=coordinator.cyberq.serial_number,
         manufacturer=coordinator.cyberq.manufacturer,
         model=coordinator.cyberq.model,
-        name=f"{coordinator.cyberq.name}",
+        name=coordinator.device_name,
         hw_version=coordinator.cyberq.hw_version,
         sw_version=coordinator.cyberq.sw_version,
     )
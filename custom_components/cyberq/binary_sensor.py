@@ -74,10 +74,19 @@ async def async_setup_entry(
 ) -> None:
     """Add Cyberq entities from a config_entry."""
     coordinator = entry.runtime_data
+    device_name = coordinator.device_name
     async_add_entities(
-        CyberqBinarySensor(coordinator, description)
-        for description in BINARY_SENSORS
-        if description.exists_fn(coordinator.data)
+        [
+            CyberqBinarySensor(
+                coordinator,
+                description,
+                entity_id=async_generate_entity_id(
+                    ENTITY_ID_FORMAT, f"{device_name}_{description.key}", hass=hass
+                ),
+            )
+            for description in BINARY_SENSORS
+            if description.exists_fn(coordinator.data)
+        ]
     )
 
 
@@ -87,33 +96,32 @@ class CyberqBinarySensor(
     """Define an Cyberq binary sensor."""
 
     _attr_has_entity_name = True
+    _last_state: tuple | None = None
     entity_description: CyberqBinarySensorEntityDescription
 
     def __init__(
         self,
         coordinator: CyberqDataUpdateCoordinator,
         description: CyberqBinarySensorEntityDescription,
+        entity_id: str,
     ) -> None:
         """Initialize."""
         super().__init__(coordinator)
         self._attr_device_info = coordinator.device_info
-        self._attr_native_value = description.value_fn(coordinator.data)
+        self._value_fn = description.value_fn
+        self._attr_is_on = self._value_fn(coordinator.data)
         self._attr_icon = description.icon
-        self._attr_unique_id = f"{coordinator.device_info['name']}_{description.key}"
-        self.entity_id = async_generate_entity_id(
-            ENTITY_ID_FORMAT, self.unique_id, hass=coordinator.hass
-        )
+        self._attr_unique_id = f"{coordinator.device_name}_{description.key}"
+        self.entity_id = entity_id
         self.entity_description = description
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return the state of the sensor."""
-        return self.entity_description.value_fn(self.coordinator.data)
-
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self._attr_native_value = self.entity_description.value_fn(
-            self.coordinator.data
-        )
+        value = self._value_fn(self.coordinator.data)
+        state = (self.available, value)
+        if state == self._last_state:
+            return
+        self._last_state = state
+        self._attr_is_on = value
         self.async_write_ha_state()
@@ -27,6 +27,7 @@ SOFTWARE.
 from __future__ import annotations
 
 import logging
+import operator
 from typing import Any, Final
 
 from homeassistant.components.climate import (
@@ -44,10 +45,25 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import CyberqConfigEntry, CyberqDataUpdateCoordinator
 from .const import STATUS_ICONS
-from .cyberq import CYBERQ_SENSORS
+from .cyberq import CYBERQ_SENSORS, CyberqSensorTemperature
 
 _LOGGER = logging.getLogger(__name__)
 
+_TEMPERATURE_BOUNDS: Final = {
+    key: (float(sensor.min_value), float(sensor.max_value))
+    for key, sensor in CYBERQ_SENSORS.items()
+    if isinstance(sensor, CyberqSensorTemperature)
+}
+
+
+# (unique id prefix, CyberQ key prefix, default name)
+_PROBES: Final = (
+    ("pit", "COOK", "Pit"),
+    ("food1", "FOOD1", "Food 1"),
+    ("food2", "FOOD2", "Food 2"),
+    ("food3", "FOOD3", "Food 3"),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -56,44 +72,26 @@ async def async_setup_entry(
 ) -> None:
     """Set up the demo climate platform."""
     coordinator = entry.runtime_data
+    device_name = coordinator.device_name
     async_add_entities(
         [
             CyberqClimate(
                 coordinator,
-                cyberq_name_key="COOK_NAME",
-                cyberq_temp_key="COOK_TEMP",
-                cyberq_setpoint_key="COOK_SET",
-                cyberq_status_key="COOK_STATUS",
-                prefix="pit",
-                translation_placeholders={"cook_name": "Pit"},
-            ),
-            CyberqClimate(
-                coordinator,
-                cyberq_name_key="FOOD1_NAME",
-                cyberq_temp_key="FOOD1_TEMP",
-                cyberq_setpoint_key="FOOD1_SET",
-                cyberq_status_key="FOOD1_STATUS",
-                prefix="food1",
-                translation_placeholders={"cook_name": "Food 1"},
-            ),
-            CyberqClimate(
-                coordinator,
-                cyberq_name_key="FOOD2_NAME",
-                cyberq_temp_key="FOOD2_TEMP",
-                cyberq_setpoint_key="FOOD2_SET",
-                cyberq_status_key="FOOD2_STATUS",
-                prefix="food2",
-                translation_placeholders={"cook_name": "Food 2"},
-            ),
-            CyberqClimate(
-                coordinator,
-                cyberq_name_key="FOOD3_NAME",
-                cyberq_temp_key="FOOD3_TEMP",
-                cyberq_setpoint_key="FOOD3_SET",
-                cyberq_status_key="FOOD3_STATUS",
-                prefix="food3",
-                translation_placeholders={"cook_name": "Food 3"},
-            ),
+                cyberq_name_key=f"{probe}_NAME",
+                cyberq_temp_key=f"{probe}_TEMP",
+                cyberq_setpoint_key=f"{probe}_SET",
+                cyberq_status_key=f"{probe}_STATUS",
+                prefix=prefix,
+                entity_id=async_generate_entity_id(
+                    ENTITY_ID_FORMAT, f"{device_name}_{prefix}_probe", hass=hass
+                ),
+                translation_placeholders={"cook_name": cook_name},
+            )
+            for prefix, probe, cook_name in _PROBES
+            if all(
+                hasattr(coordinator.data, f"{probe}_{suffix}")
+                for suffix in ("NAME", "TEMP", "SET", "STATUS")
+            )
         ]
     )
 
@@ -109,11 +107,13 @@ class CyberqClimate(CoordinatorEntity[CyberqDataUpdateCoordinator], ClimateEntit
     _attr_supported_features = ClimateEntityFeature.TARGET_TEMPERATURE
     _attr_precision = PRECISION_TENTHS
     _attr_temperature_unit = UnitOfTemperature.FAHRENHEIT
+    _last_state: tuple | None = None
 
     def __init__(
         self,
         coordinator: CyberqDataUpdateCoordinator,
         prefix: str,
+        entity_id: str,
         translation_placeholders: dict[str, str],
         cyberq_name_key: str,
         cyberq_temp_key: str,
@@ -129,50 +129,49 @@ class CyberqClimate(CoordinatorEntity[CyberqDataUpdateCoordinator], ClimateEntit
         self._cyberq_status_key = cyberq_status_key
         self._attr_translation_key = "probe"
         self._attr_translation_placeholders = translation_placeholders
-        self._attr_max_temp = float(
-            str(CYBERQ_SENSORS[self._cyberq_setpoint_key].max_value)
-        )
-        self._attr_min_temp = float(
-            str(CYBERQ_SENSORS[self._cyberq_setpoint_key].min_value)
+        self._attr_min_temp, self._attr_max_temp = _TEMPERATURE_BOUNDS[
+            cyberq_setpoint_key
+        ]
+        self._getter = operator.attrgetter(
+            cyberq_temp_key, cyberq_setpoint_key, cyberq_status_key
         )
 
         self._update_sub()
-        self._attr_unique_id = f"{self.coordinator.device_info['name']}_{prefix}_probe"
-        self.entity_id = async_generate_entity_id(
-            ENTITY_ID_FORMAT, self.unique_id, hass=coordinator.hass
-        )
+        self._attr_unique_id = f"{self.coordinator.device_name}_{prefix}_probe"
+        self.entity_id = entity_id
 
     def _update_sub(self) -> None:
-        self._attr_target_temperature = float(
-            getattr(self.coordinator.data, self._cyberq_setpoint_key).value
-        )
+        temp, setpoint, status = self._getter(self.coordinator.data)
+        self._attr_target_temperature = target = float(setpoint.value)
 
         try:
-            self._attr_current_temperature = float(
-                getattr(self.coordinator.data, self._cyberq_temp_key).value
-            )
+            self._attr_current_temperature = float(temp.value)
         except ValueError:
             self._attr_current_temperature = None
-        if self._attr_target_temperature == self._attr_min_temp or getattr(
-            self.coordinator.data, self._cyberq_status_key
-        ).value in ("error", "shutdown"):
+        if target == self._attr_min_temp or status.value in ("error", "shutdown"):
             self._attr_hvac_mode = HVACMode.OFF
         else:
             self._attr_hvac_mode = HVACMode.HEAT
-        self._attr_icon = STATUS_ICONS[
-            getattr(self.coordinator.data, self._cyberq_status_key).index
-        ]
+        self._attr_icon = STATUS_ICONS[status.index]
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator.."""
         self._update_sub()
+        state = (
+            self.available,
+            self._attr_target_temperature,
+            self._attr_current_temperature,
+            self._attr_hvac_mode,
+            self._attr_icon,
+        )
+        if state == self._last_state:
+            return
+        self._last_state = state
         self.async_write_ha_state()
 
     async def async_set_temperature(self, **kwags: Any) -> None:
         """Set new target temperature."""
-        await self.coordinator.cyberq.async_set(
+        await self.coordinator.async_set(
             self._cyberq_setpoint_key, kwags["temperature"]
         )
-        await self.coordinator.async_request_refresh()
-        self.async_write_ha_state()
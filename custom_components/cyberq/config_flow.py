@@ -37,7 +37,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DOMAIN
+from .const import DOMAIN, HTTP_HEADERS
 from .cyberq import CyberqDevice
 
 _LOGGER = logging.getLogger(__name__)
@@ -60,6 +60,7 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
         host=data[CONF_HOST],
         session=async_get_clientsession(hass),
         port=data[CONF_PORT],
+        headers=HTTP_HEADERS,
     )
     try:
         await cyberq.async_update()
@@ -29,19 +29,28 @@ from typing import Final
 
 DOMAIN: Final = "cyberq"
 
-UPDATE_INTERVAL: Final = timedelta(seconds=5)
-
+# Ask the controller to keep the connection open between polls
+HTTP_HEADERS: Final = {"Connection": "keep-alive"}
 
-STATUS_ICONS: Final = {
-    0: "mdi:fire",
-    1: "mdi:thermometer-high",
-    2: "mdi:thermometer-low",
-    3: "mdi:check-circle",
-    4: "mdi:thermometer-alert",
-    5: "mdi:pause-circle",
-    6: "mdi:bell-ring",
-    7: "mdi:power",
-}
+UPDATE_INTERVAL: Final = timedelta(seconds=5)
+UPDATE_INTERVAL_MAX: Final = timedelta(seconds=60)
+UPDATE_INTERVAL_BACKOFF: Final = 1.5
+UPDATE_IDLE_POLLS: Final = 3
+# Seconds to collect refresh requests, e.g. from a slider, into one refresh
+REQUEST_REFRESH_COOLDOWN: Final = 0.3
+
+
+# Indexed by the probe status index
+STATUS_ICONS: Final = (
+    "mdi:fire",
+    "mdi:thermometer-high",
+    "mdi:thermometer-low",
+    "mdi:check-circle",
+    "mdi:thermometer-alert",
+    "mdi:pause-circle",
+    "mdi:bell-ring",
+    "mdi:power",
+)
 
 TIMERACTION_ICONS: Final = {
     "No Action": "mdi:timer-off",
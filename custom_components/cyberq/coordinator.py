@@ -26,14 +26,24 @@ SOFTWARE.
 
 import logging
 from asyncio import timeout
+from typing import Any
+from xml.etree.ElementTree import ParseError
 from xml.parsers.expat import ExpatError
 
 import aiohttp
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, UPDATE_INTERVAL
+from .const import (
+    DOMAIN,
+    REQUEST_REFRESH_COOLDOWN,
+    UPDATE_IDLE_POLLS,
+    UPDATE_INTERVAL,
+    UPDATE_INTERVAL_BACKOFF,
+    UPDATE_INTERVAL_MAX,
+)
 from .cyberq import CyberqDevice, CyberqSensors
 
 _LOGGER = logging.getLogger(__name__)
@@ -43,6 +53,8 @@ class CyberqDataUpdateCoordinator(DataUpdateCoordinator[CyberqSensors]):
     """Class to manage fetching Cyberq data from the controller."""
 
     device_info: DeviceInfo
+    # Prefix of the unique ids and entity ids
+    device_name: str
 
     def __init__(self, hass: HomeAssistant, cyberq: CyberqDevice) -> None:
         """Initialize."""
@@ -52,21 +64,59 @@ class CyberqDataUpdateCoordinator(DataUpdateCoordinator[CyberqSensors]):
             name=DOMAIN,
             update_interval=UPDATE_INTERVAL,
             always_update=False,
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=REQUEST_REFRESH_COOLDOWN,
+                immediate=False,
+            ),
         )
         self._device = cyberq
         self.cyberq = cyberq
+        self._idle_polls = 0
 
     async def _async_update_data(self) -> CyberqSensors:
         """Update data via library."""
         try:
             async with timeout(20):
                 data = await self._device.async_update()
-                _LOGGER.debug(str(data))
+                _LOGGER.debug("%s", data)
         except (
             TimeoutError,
             ExpatError,
+            ParseError,
             ConnectionError,
             aiohttp.ClientError,
         ) as error:
             raise UpdateFailed(error) from error
+
+        if data == self.data:
+            self._idle_polls += 1
+            if self._idle_polls >= UPDATE_IDLE_POLLS:
+                self._bump_interval()
+        else:
+            self.async_reset_update_interval()
+
         return data
+
+    def _bump_interval(self) -> None:
+        """Back off polling while the controller reports no changes."""
+        interval = self.update_interval or UPDATE_INTERVAL
+        self.update_interval = min(
+            UPDATE_INTERVAL_MAX, interval * UPDATE_INTERVAL_BACKOFF
+        )
+
+    async def async_set(self, key: str, value: Any) -> None:
+        """Change a setting and publish the new value right away."""
+        await self.cyberq.async_set(key, value)
+        self.async_reset_update_interval()
+        self.async_set_updated_data(self.cyberq.sensors)
+        # Confirm values that are only reported in the status, the debouncer
+        # delays the refresh so this does not hold up the caller
+        await self.async_request_refresh()
+
+    @callback
+    def async_reset_update_interval(self) -> None:
+        """Return to the fastest polling rate, e.g. after a change."""
+        self._idle_polls = 0
+        self.update_interval = UPDATE_INTERVAL
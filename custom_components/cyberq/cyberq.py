@@ -25,14 +25,15 @@ SOFTWARE.
 """
 
 import asyncio
-import copy
-import datetime
 import logging
 import re
 import sys
-import urllib.parse
+import time
+from collections.abc import Iterable, Mapping
 from enum import StrEnum
-from typing import Any, Final, Self
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final, Self
+from xml.etree import ElementTree as ET
 
 import aiohttp
 import xmltodict
@@ -49,6 +50,8 @@ CYBERQ_ALARMDEV_MIN: Final = 10
 CYBERQ_ALARMDEV_MAX: Final = 100
 CYBERQ_LCD_MIN: Final = 0
 CYBERQ_LCD_MAX: Final = 100
+# Seconds between reads of the configuration
+CYBERQ_CONFIG_INTERVAL: Final = 600.0
 
 
 class Page(StrEnum):
@@ -60,10 +63,67 @@ class Page(StrEnum):
     WIFI = "wifi.htm"
 
 
+class CyberqSensorState:
+    """Value of a CyberQ sensor, never modified once created."""
+
+    __slots__ = ("sensor", "value")
+    # Attributes included in diagnostics
+    DIAG_FIELDS: tuple[str, ...] = ("value",)
+
+    def __init__(self, sensor: "CyberqSensor", value: Any) -> None:
+        """Init a CyberQ sensor value."""
+        self.sensor = sensor
+        self.value = value
+
+    def __str__(self) -> str:
+        """Return a string representation of the sensor value."""
+        return (
+            f"Name: {self.name} Type: {type(self.sensor).__name__} Value: {self.value}"
+        )
+
+    def __key(self) -> tuple:
+        """Key for __eq__ and __hash__."""
+        return (self.name, self.value)
+
+    def __hash__(self) -> int:
+        """Hash."""
+        return hash(self.__key())
+
+    def __eq__(self, other: object) -> bool:
+        """Compare."""
+        if type(other) is type(self):
+            return self.__key() == other.__key()  # type: ignore[attr-defined]
+        return NotImplemented
+
+    @property
+    def name(self) -> str:
+        """Return the name of the sensor."""
+        return self.sensor.name
+
+
+class CyberqSensorListState(CyberqSensorState):
+    """Value of a CyberQ list sensor, never modified once created."""
+
+    __slots__ = ("index",)
+    DIAG_FIELDS: tuple[str, ...] = ("value", "index")
+
+    def __init__(self, sensor: "CyberqSensorList", index: int) -> None:
+        """Init a CyberQ list sensor value."""
+        super().__init__(sensor, sensor.values[index])
+        self.index = index
+
+    def __str__(self) -> str:
+        """Return a string representation of the sensor value."""
+        return f"{super().__str__()} Index: {self.index}"
+
+
 class CyberqSensor:
     """Description of a CyberQ sensor."""
 
-    _value: Any
+    __slots__ = ("_alias", "_page", "name", "read_only")
+    # Attributes included in diagnostics
+    DIAG_FIELDS: tuple[str, ...] = ("name", "_alias", "_page", "read_only")
+
     values: Any
     min_value: Any
     max_value: Any
@@ -86,21 +146,7 @@ class CyberqSensor:
 
     def __str__(self) -> str:
         """Return a string representation of the sensor."""
-        return f"Name: {self.name} Type: {type(self).__name__} Value: {self.value}"
-
-    def __key(self) -> tuple:
-        """Key for __eq__ and __hash__."""
-        return (self.name, self.value)
-
-    def __hash__(self) -> int:
-        """Hash."""
-        return hash(self.__key())
-
-    def __eq__(self, other: object) -> bool:
-        """Compare."""
-        if isinstance(other, CyberqSensor):
-            return self.__key() == other.__key()
-        return NotImplemented
+        return f"Name: {self.name} Type: {type(self).__name__}"
 
     @property
     def alias(self) -> str | None:
@@ -118,21 +164,23 @@ class CyberqSensor:
 
         raise ValueError(f"Page not defined for {self.name}")
 
-    @property
-    def value(self) -> Any:
-        """Return the value of the sensor."""
-        return self._value
+    def local(self, value: Any) -> CyberqSensorState:
+        """Return the value set from user input, until read from the device."""
+        return CyberqSensorState(self, value)
 
 
 class CyberqSensorBoolean(CyberqSensor):
     """Description of a CyberQ boolean sensor."""
 
-    _value: bool
+    __slots__ = ()
 
-    def accept(self, value: Any) -> Self:
+    def accept(self, value: Any) -> CyberqSensorState:
         """Import a value from device."""
-        self._value = bool(int(value))
-        return self
+        return CyberqSensorState(self, bool(int(value)))
+
+    def local(self, value: Any) -> CyberqSensorState:
+        """Return the value set from user input, until read from the device."""
+        return CyberqSensorState(self, bool(value))
 
     def export(self, value: Any) -> Any:
         """Prep the value for setting on the device."""
@@ -145,7 +193,9 @@ class CyberqSensorBoolean(CyberqSensor):
 class CyberqSensorList(CyberqSensor):
     """Description of a CyberQ list sensor."""
 
-    index: int
+    __slots__ = ("values",)
+    DIAG_FIELDS: tuple[str, ...] = (*CyberqSensor.DIAG_FIELDS, "values")
+
     values: list[str]
 
     def __init__(
@@ -161,13 +211,16 @@ class CyberqSensorList(CyberqSensor):
         super().__init__(name=name, alias=alias, read_only=read_only, page=page)
         self.values = values
 
-    def accept(self, value: Any) -> Self:
+    def accept(self, value: Any) -> CyberqSensorListState:
         """Import a value from device."""
         index = int(value)
-        if index > len(self.values):
-            raise ValueError(f"Invalid import value for {self.name}: {self.value}")
-        self.index = index
-        return self
+        if not 0 <= index < len(self.values):
+            raise ValueError(f"Invalid import value for {self.name}: {value}")
+        return CyberqSensorListState(self, index)
+
+    def local(self, value: Any) -> CyberqSensorListState:
+        """Return the value set from user input, until read from the device."""
+        return CyberqSensorListState(self, self.values.index(value))
 
     def export(self, value: Any) -> Any:
         """Prep the value for setting on the device."""
@@ -176,23 +229,12 @@ class CyberqSensorList(CyberqSensor):
 
         return self.values.index(value)
 
-    def __str__(self) -> str:
-        """Return a string representation of the sensor."""
-        return (
-            f"Name: {self.name} Type: {type(self).__name__} "
-            f"Value: {self.value} Index: {self.index}"
-        )
-
-    @property
-    def value(self) -> str:
-        """Return the value of the sensor."""
-        return self.values[int(self.index)]
-
 
 class CyberqSensorNumber(CyberqSensor):
     """Description of a CyberQ number sensor."""
 
-    _value: float
+    __slots__ = ("max_value", "min_value")
+    DIAG_FIELDS: tuple[str, ...] = (*CyberqSensor.DIAG_FIELDS, "min_value", "max_value")
 
     def __init__(
         self,
@@ -209,10 +251,13 @@ class CyberqSensorNumber(CyberqSensor):
         self.min_value = min_value
         self.max_value = max_value
 
-    def accept(self, value: Any) -> Self:
+    def accept(self, value: Any) -> CyberqSensorState:
         """Import a value from device."""
-        self._value = int(value)
-        return self
+        return CyberqSensorState(self, int(value))
+
+    def local(self, value: Any) -> CyberqSensorState:
+        """Return the value set from user input, until read from the device."""
+        return CyberqSensorState(self, int(value))
 
     def export(self, value: Any) -> Any:
         """Prep the value for setting on the device."""
@@ -227,12 +272,11 @@ class CyberqSensorNumber(CyberqSensor):
 class CyberqSensorString(CyberqSensor):
     """Description of a CyberQ string sensor."""
 
-    _value: str
+    __slots__ = ()
 
-    def accept(self, value: Any) -> Self:
+    def accept(self, value: Any) -> CyberqSensorState:
         """Import a value from device."""
-        self._value = value
-        return self
+        return CyberqSensorState(self, value)
 
     def export(self, value: Any) -> Any:
         """Prep the value for setting on the device."""
@@ -245,17 +289,15 @@ class CyberqSensorString(CyberqSensor):
 class CyberqSensorTimer(CyberqSensor):
     """Description of a CyberQ timer sensor."""
 
-    _TIMER_RE = re.compile(r"^(?P<hours>\d{2}):(?P<minutes>\d{2}):(?P<seconds>\d{2})$")
-
-    _value: str
+    __slots__ = ()
 
-    def accept(self, value: Any) -> Self:
+    def accept(self, value: Any) -> CyberqSensorState:
         """Import a value from device."""
-        match = self._TIMER_RE.match(value)
-        if not match:
+        # HH:MM:SS
+        parts = value.split(":")
+        if [len(part) for part in parts] != [2, 2, 2] or not "".join(parts).isdecimal():
             raise ValueError(f"Invalid timer value for {self.name}: {value}")
-        self._value = value
-        return self
+        return CyberqSensorState(self, value)
 
     def export(self, value: Any) -> Any:
         """Prep the value for setting on the device."""
@@ -268,17 +310,22 @@ class CyberqSensorTimer(CyberqSensor):
 class CyberqSensorTemperature(CyberqSensor):
     """Description of a CyberQ temperature sensor."""
 
-    _value: float
+    __slots__ = ()
+    DIAG_FIELDS: tuple[str, ...] = (*CyberqSensor.DIAG_FIELDS, "min_value", "max_value")
+
     min_value = CYBERQ_TEMPERATURE_MIN
     max_value = CYBERQ_TEMPERATURE_MAX
 
-    def accept(self, value: Any) -> Self:
+    def accept(self, value: Any) -> CyberqSensorState:
         """Import a value from device."""
         try:
-            self._value = float(value) / 10.0
+            return CyberqSensorState(self, float(value) / 10.0)
         except ValueError:
-            self._value = value
-        return self
+            return CyberqSensorState(self, value)
+
+    def local(self, value: Any) -> CyberqSensorState:
+        """Return the value set from user input, until read from the device."""
+        return CyberqSensorState(self, float(value))
 
     def export(self, value: Any) -> Any:
         """Prep the value for setting on the device."""
@@ -301,90 +348,118 @@ _STATUS_VALUES: Final = [
     "shutdown",
 ]
 
-CYBERQ_SENSORS: Final = {
-    "ALARM_BEEPS": CyberqSensorList(
-        "ALARM_BEEPS", page=Page.SYSTEM, values=["0", "1", "2", "3", "4", "5"]
-    ),
-    "ALARMDEV": CyberqSensorNumber(
-        "ALARMDEV",
-        page=Page.CONTROL,
-        min_value=CYBERQ_ALARMDEV_MIN,
-        max_value=CYBERQ_ALARMDEV_MAX,
-    ),
-    "COOK_CYCTIME": CyberqSensorNumber(
-        "COOK_CYCTIME",
-        alias="CYCTIME",
-        page=Page.INDEX,
-        min_value=CYBERQ_CYCLETIME_MIN,
-        max_value=CYBERQ_CYCLETIME_MAX,
-    ),
-    "COOK_NAME": CyberqSensorString("COOK_NAME", page=Page.INDEX),
-    "COOK_PROPBAND": CyberqSensorNumber(
-        "COOK_PROPBAND",
-        alias="PROPBAND",
-        page=Page.INDEX,
-        min_value=CYBERQ_PROPBAND_MIN,
-        max_value=CYBERQ_PROPBAND_MAX,
-    ),
-    "COOK_RAMP": CyberqSensorList(
-        "COOK_RAMP",
-        page=Page.CONTROL,
-        values=["None", "Food 1", "Food 2", "Food 3"],
-    ),
-    "COOK_SET": CyberqSensorTemperature("COOK_SET", page=Page.INDEX),
-    "COOK_STATUS": CyberqSensorList(
-        "COOK_STATUS", values=_STATUS_VALUES, read_only=True
-    ),
-    "COOK_TEMP": CyberqSensorTemperature("COOK_TEMP", read_only=True),
-    "COOKHOLD": CyberqSensorTemperature("COOKHOLD", page=Page.CONTROL),
-    "DEG_UNITS": CyberqSensorList(
-        "DEG_UNITS", page=Page.SYSTEM, values=["Celsius", "Fahrenheit"]
-    ),
-    "FAN_SHORTED": CyberqSensorBoolean("FAN_SHORTED", read_only=True),
-    "FOOD1_NAME": CyberqSensorString("FOOD1_NAME", page=Page.INDEX),
-    "FOOD1_SET": CyberqSensorTemperature("FOOD1_SET", page=Page.INDEX),
-    "FOOD1_STATUS": CyberqSensorList(
-        "FOOD1_STATUS", values=_STATUS_VALUES, read_only=True
-    ),
-    "FOOD1_TEMP": CyberqSensorTemperature("FOOD1_TEMP", read_only=True),
-    "FOOD2_NAME": CyberqSensorString("FOOD2_NAME", page=Page.INDEX),
-    "FOOD2_SET": CyberqSensorTemperature("FOOD2_SET", page=Page.INDEX),
-    "FOOD2_STATUS": CyberqSensorList(
-        "FOOD2_STATUS", values=_STATUS_VALUES, read_only=True
-    ),
-    "FOOD2_TEMP": CyberqSensorTemperature("FOOD2_TEMP", read_only=True),
-    "FOOD3_NAME": CyberqSensorString("FOOD3_NAME", page=Page.INDEX),
-    "FOOD3_SET": CyberqSensorTemperature("FOOD3_SET", page=Page.INDEX),
-    "FOOD3_STATUS": CyberqSensorList(
-        "FOOD3_STATUS", values=_STATUS_VALUES, read_only=True
-    ),
-    "FOOD3_TEMP": CyberqSensorTemperature("FOOD3_TEMP", read_only=True),
-    "KEY_BEEPS": CyberqSensorBoolean("KEY_BEEPS", page=Page.SYSTEM),
-    "LCD_BACKLIGHT": CyberqSensorNumber(
+# Shared by all devices, the values read are kept in CyberqSensorState objects
+CYBERQ_SENSORS: Final = MappingProxyType(
+    {
+        "ALARM_BEEPS": CyberqSensorList(
+            "ALARM_BEEPS", page=Page.SYSTEM, values=["0", "1", "2", "3", "4", "5"]
+        ),
+        "ALARMDEV": CyberqSensorNumber(
+            "ALARMDEV",
+            page=Page.CONTROL,
+            min_value=CYBERQ_ALARMDEV_MIN,
+            max_value=CYBERQ_ALARMDEV_MAX,
+        ),
+        "COOK_CYCTIME": CyberqSensorNumber(
+            "COOK_CYCTIME",
+            alias="CYCTIME",
+            page=Page.INDEX,
+            min_value=CYBERQ_CYCLETIME_MIN,
+            max_value=CYBERQ_CYCLETIME_MAX,
+        ),
+        "COOK_NAME": CyberqSensorString("COOK_NAME", page=Page.INDEX),
+        "COOK_PROPBAND": CyberqSensorNumber(
+            "COOK_PROPBAND",
+            alias="PROPBAND",
+            page=Page.INDEX,
+            min_value=CYBERQ_PROPBAND_MIN,
+            max_value=CYBERQ_PROPBAND_MAX,
+        ),
+        "COOK_RAMP": CyberqSensorList(
+            "COOK_RAMP",
+            page=Page.CONTROL,
+            values=["None", "Food 1", "Food 2", "Food 3"],
+        ),
+        "COOK_SET": CyberqSensorTemperature("COOK_SET", page=Page.INDEX),
+        "COOK_STATUS": CyberqSensorList(
+            "COOK_STATUS", values=_STATUS_VALUES, read_only=True
+        ),
+        "COOK_TEMP": CyberqSensorTemperature("COOK_TEMP", read_only=True),
+        "COOKHOLD": CyberqSensorTemperature("COOKHOLD", page=Page.CONTROL),
+        "DEG_UNITS": CyberqSensorList(
+            "DEG_UNITS", page=Page.SYSTEM, values=["Celsius", "Fahrenheit"]
+        ),
+        "FAN_SHORTED": CyberqSensorBoolean("FAN_SHORTED", read_only=True),
+        "FOOD1_NAME": CyberqSensorString("FOOD1_NAME", page=Page.INDEX),
+        "FOOD1_SET": CyberqSensorTemperature("FOOD1_SET", page=Page.INDEX),
+        "FOOD1_STATUS": CyberqSensorList(
+            "FOOD1_STATUS", values=_STATUS_VALUES, read_only=True
+        ),
+        "FOOD1_TEMP": CyberqSensorTemperature("FOOD1_TEMP", read_only=True),
+        "FOOD2_NAME": CyberqSensorString("FOOD2_NAME", page=Page.INDEX),
+        "FOOD2_SET": CyberqSensorTemperature("FOOD2_SET", page=Page.INDEX),
+        "FOOD2_STATUS": CyberqSensorList(
+            "FOOD2_STATUS", values=_STATUS_VALUES, read_only=True
+        ),
+        "FOOD2_TEMP": CyberqSensorTemperature("FOOD2_TEMP", read_only=True),
+        "FOOD3_NAME": CyberqSensorString("FOOD3_NAME", page=Page.INDEX),
+        "FOOD3_SET": CyberqSensorTemperature("FOOD3_SET", page=Page.INDEX),
+        "FOOD3_STATUS": CyberqSensorList(
+            "FOOD3_STATUS", values=_STATUS_VALUES, read_only=True
+        ),
+        "FOOD3_TEMP": CyberqSensorTemperature("FOOD3_TEMP", read_only=True),
+        "KEY_BEEPS": CyberqSensorBoolean("KEY_BEEPS", page=Page.SYSTEM),
+        "LCD_BACKLIGHT": CyberqSensorNumber(
+            "LCD_BACKLIGHT",
+            page=Page.SYSTEM,
+            min_value=CYBERQ_LCD_MIN,
+            max_value=CYBERQ_LCD_MAX,
+        ),
+        "LCD_CONTRAST": CyberqSensorNumber(
+            "LCD_CONTRAST",
+            page=Page.SYSTEM,
+            min_value=CYBERQ_LCD_MIN,
+            max_value=CYBERQ_LCD_MAX,
+        ),
+        "MENU_SCROLLING": CyberqSensorBoolean("MENU_SCROLLING", page=Page.SYSTEM),
+        "OPENDETECT": CyberqSensorBoolean("OPENDETECT", page=Page.CONTROL),
+        "OUTPUT_PERCENT": CyberqSensorNumber(
+            "OUTPUT_PERCENT", min_value=0, max_value=100, read_only=True
+        ),
+        "TIMEOUT_ACTION": CyberqSensorList(
+            "TIMEOUT_ACTION",
+            page=Page.CONTROL,
+            values=["No Action", "Hold", "Alarm", "Shutdown"],
+        ),
+        "TIMER_CURR": CyberqSensorTimer("TIMER_CURR", read_only=True),
+        "TIMER_STATUS": CyberqSensorList(
+            "TIMER_STATUS", values=_STATUS_VALUES, read_only=True
+        ),
+    }
+)
+
+_ALIAS_TO_NAME: Final = {
+    sensor.alias: name
+    for name, sensor in CYBERQ_SENSORS.items()
+    if sensor.alias is not None
+}
+
+# Map both sensor names and aliases to the sensor name
+_KEY_TO_NAME: Final = {name: name for name in CYBERQ_SENSORS} | _ALIAS_TO_NAME
+
+# Sensors read from each section of config.xml
+_CONFIG_SECTION_KEYS: Final = {
+    "COOK": ("COOK_NAME", "COOK_SET"),
+    "FOOD1": ("FOOD1_NAME", "FOOD1_SET"),
+    "FOOD2": ("FOOD2_NAME", "FOOD2_SET"),
+    "FOOD3": ("FOOD3_NAME", "FOOD3_SET"),
+    "CONTROL": ("TIMEOUT_ACTION", "COOKHOLD", "ALARMDEV", "OPENDETECT"),
+    "SYSTEM": (
+        "MENU_SCROLLING",
         "LCD_BACKLIGHT",
-        page=Page.SYSTEM,
-        min_value=CYBERQ_LCD_MIN,
-        max_value=CYBERQ_LCD_MAX,
-    ),
-    "LCD_CONTRAST": CyberqSensorNumber(
         "LCD_CONTRAST",
-        page=Page.SYSTEM,
-        min_value=CYBERQ_LCD_MIN,
-        max_value=CYBERQ_LCD_MAX,
-    ),
-    "MENU_SCROLLING": CyberqSensorBoolean("MENU_SCROLLING", page=Page.SYSTEM),
-    "OPENDETECT": CyberqSensorBoolean("OPENDETECT", page=Page.CONTROL),
-    "OUTPUT_PERCENT": CyberqSensorNumber(
-        "OUTPUT_PERCENT", min_value=0, max_value=100, read_only=True
-    ),
-    "TIMEOUT_ACTION": CyberqSensorList(
-        "TIMEOUT_ACTION",
-        page=Page.CONTROL,
-        values=["No Action", "Hold", "Alarm", "Shutdown"],
-    ),
-    "TIMER_CURR": CyberqSensorTimer("TIMER_CURR", read_only=True),
-    "TIMER_STATUS": CyberqSensorList(
-        "TIMER_STATUS", values=_STATUS_VALUES, read_only=True
+        "ALARM_BEEPS",
+        "KEY_BEEPS",
     ),
 }
 
@@ -392,64 +467,78 @@ CYBERQ_SENSORS: Final = {
 class CyberqSensors:
     """Sensor data."""
 
-    _NAME_RE = re.compile(r"(COOK|FOOD[123])_NAME$")
-    _TEMP_RE = re.compile(r"(COOK|FOOD[123])_(SET|TEMP)$")
-    _STATUS_RE = re.compile(r"(COOK|FOOD[123]|TIMER)_STATUS$")
-    _STATUS = ("OK", "HIGH", "LOW", "DONE", "ERROR", "HOLD", "ALARM", "SHUTDOWN")
-    _TIMER_RE = re.compile(r"^(?P<hours>\d{2}):(?P<minutes>\d{2}):(?P<seconds>\d{2})$")
+    # Each sensor read is also kept in a slot named after it, for data.COOK_TEMP
+    __slots__ = ("_sensors", "_sorted_keys", *CYBERQ_SENSORS)
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        sensors: dict[str, CyberqSensorState] | None = None,
+        sorted_keys: tuple[str, ...] | None = None,
+    ) -> None:
         """Init sensors."""
-        self._sensors: dict[str, Any] = {}
-
-    def __deepcopy__(self, memo: Any) -> Any:
-        """
-        Deep copy.
+        self._sensors = sensors if sensors is not None else {}
+        # Sorted sensor names for __str__, reset when a new name is added
+        self._sorted_keys = sorted_keys
+        for name, sensor in self._sensors.items():
+            setattr(self, name, sensor)
 
-        Prevents __getattr__ from recursing as new struct is created.
-        """
-        new = CyberqSensors()
-        new._sensors = copy.deepcopy(self._sensors)
-        return new
+    def copy(self) -> Self:
+        """Return a copy that can be updated without changing this one."""
+        # The values are immutable, so they can be shared
+        return type(self)(self._sensors.copy(), self._sorted_keys)
 
     def __eq__(self, other: object) -> bool:
         """Compare."""
-        if not isinstance(other, CyberqSensors):
-            return False
+        if type(other) is not type(self):
+            return NotImplemented
 
-        return self._sensors == other._sensors
+        return self._sensors == other._sensors  # type: ignore[attr-defined]
 
-    def __hash__(self) -> int:
-        """Hash."""
-        return hash(self._sensors)
+    # Updated in place by accept, so not hashable
+    __hash__ = None  # type: ignore[assignment]
 
-    def __getattr__(self, key: str) -> Any:
+    if TYPE_CHECKING:
+
+        def __getattr__(self, key: str) -> Any:
+            """Retrieve a sensor value, the slots are not known to type checkers."""
+
+    def __getitem__(self, key: str) -> Any:
         """Retrieve a sensor value."""
-        if key in self._sensors:
-            return self._sensors[key]
-        raise AttributeError(f"CyberqSensor: Invalid key: {key}")
+        return self._sensors[key]
 
     def accept(self, key: str, value: str) -> None:
         """Set a value read from device, convert as needed."""
-        if key not in CYBERQ_SENSORS:
-            for sensor in CYBERQ_SENSORS.values():
-                if sensor.alias == key:
-                    key = sensor.name
-                    break
-            else:
+        self.accept_batch(((key, value),))
+
+    def accept_batch(self, items: Iterable[tuple[str, str]]) -> None:
+        """Set (key, value) pairs read from device, convert as needed."""
+        sensors = self._sensors
+        for key, value in items:
+            name = _KEY_TO_NAME.get(key)
+            if name is None:
                 raise AttributeError(f"CyberqSensor.accept: Invalid key: {key}")
 
-        sensor = copy.deepcopy(CYBERQ_SENSORS[key])
-        self._sensors[sensor.name] = sensor.accept(value)  # type: ignore[attr-defined]
+            if name not in sensors:
+                self._sorted_keys = None
+            sensors[name] = sensor = CYBERQ_SENSORS[name].accept(value)  # type: ignore[attr-defined]
+            setattr(self, name, sensor)
+
+    def set_local(self, key: str, value: Any) -> None:
+        """Set a value from user input until it is read from the device."""
+        if key not in self._sensors:
+            self._sorted_keys = None
+        self._sensors[key] = sensor = CYBERQ_SENSORS[key].local(value)
+        setattr(self, key, sensor)
 
     def __str__(self) -> str:
         """Return a string representation of the sensors."""
-        return "\n\t".join(
-            [f"{key}={value}" for key, value in sorted(self._sensors.items())]
-        )
+        sensors = self._sensors
+        if self._sorted_keys is None:
+            self._sorted_keys = tuple(sorted(sensors))
+        return "\n\t".join(f"{key}={sensors[key]}" for key in self._sorted_keys)
 
     @property
-    def sensors(self) -> dict[str, Any]:
+    def sensors(self) -> dict[str, CyberqSensorState]:
         """Return the sensors."""
         return self._sensors
 
@@ -457,58 +546,72 @@ class CyberqSensors:
 class CyberqDevice:
     """Monitor a BBQ Guru CyberQ."""
 
-    _PARSE_VALUE_RE = re.compile(
-        r"\s*document\.mainForm\.(?P<key>[A-Z1-3]+(_[A-Z]+)?)\.(selectedIndex|value)"
-        r" = (?P<value>[^;]+);$"
+    _PARSE_PREFIX = "document.mainForm."
+    _PARSE_RE = re.compile(
+        r"\s*document\.mainForm\.(?:"
+        r"(?P<key>[A-Z1-3]+(_[A-Z]+)?)\.(selectedIndex|value) = (?P<value>[^;]+);"
+        r"|_(?P<temp_key>[A-Z1-3]+_SET|COOKHOLD)\.value"
+        r" = TempPICToHTML\((?P<temp_value>\d+),0\);}?"
+        r")$",
+        re.ASCII,
     )
-    _PARSE_TEMP_RE = re.compile(
-        r"\s*document\.mainForm\._(?P<key>[A-Z1-3]+_SET|COOKHOLD)\.value"
-        r" = TempPICToHTML\((?P<value>\d+),0\);}?$"
-    )
-    _MAC_RE = re.compile(r"\b(?P<mac>([A-Z0-9]{2}:){5}[A-Z0-9]{2})\b")
+    _MAC_RE = re.compile(r"\b(?P<mac>([A-Z0-9]{2}:){5}[A-Z0-9]{2})\b", re.ASCII)
     _VERSIONS_RE = re.compile(
-        r"FW Version<.*>(?P<sw_version>[0-9\.]+),\s*(?P<hw_version>[0-9\.]+)<"
+        r"FW Version<.*>(?P<sw_version>[0-9\.]+),\s*(?P<hw_version>[0-9\.]+)<",
+        re.ASCII,
     )
-    _NAME_RE = re.compile(r"^[\w ]+$")
 
     mac: str = ""
     serial_number: str = ""
     sw_version: str = ""
     hw_version: str = ""
     manufacturer: str = "BBQ Guru"
-    _sensors: CyberqSensors = CyberqSensors()
+    _sensors: CyberqSensors
     cyberq_cloud: bool = False
 
     def __init__(
-        self, host: str, session: aiohttp.ClientSession, port: int = 80
+        self,
+        host: str,
+        session: aiohttp.ClientSession,
+        port: int = 80,
+        headers: Mapping[str, str] | None = None,
     ) -> None:
         """Init the CyberQ."""
         self._session = session
+        self._headers = headers
         self.host = host
         self.port = port
         self._base_url = f"http://{host}:{port}"
-        self._last_config: datetime.datetime | None = None
+        # time.monotonic() when the configuration should be read again
+        self._next_config_at = 0.0
+        self._last_status: str | None = None
+        self._sensors = CyberqSensors()
+        # Keeps a set from replacing self._sensors while a poll updates it
+        self._lock = asyncio.Lock()
 
-        self._index_url = urllib.parse.urljoin(self._base_url, "index.htm")
-        self._status_url = urllib.parse.urljoin(self._base_url, "status.xml")
-        self._config_xml = urllib.parse.urljoin(self._base_url, "config.xml")
-        self._wifi_url = urllib.parse.urljoin(self._base_url, "wifi.htm")
+        self._status_url = f"{self._base_url}/status.xml"
+        self._config_xml = f"{self._base_url}/config.xml"
+        self._page_urls = {page: f"{self._base_url}/{page}" for page in Page}
 
     async def _post(self, url: str, data: dict) -> str:
         """Update a value."""
-        async with self._session.post(url, data=data) as response:
+        async with self._session.post(
+            url, data=data, headers=self._headers
+        ) as response:
             response.raise_for_status()
             return await response.text()
 
     async def _get(self, url: str) -> str:
         """Get a response data."""
-        async with self._session.get(url) as response:
+        async with self._session.get(url, headers=self._headers) as response:
             response.raise_for_status()
             return await response.text()
 
     async def _wifi(self) -> None:
         """Read WiFi config page."""
-        text = await self._get(self._wifi_url)
+        text = await self._get(self._page_urls[Page.WIFI])
+        # Keep the last match on the page, the serial number and so the
+        # device identity are derived from the MAC
         for line in text.split("\r\n"):
             match = self._MAC_RE.search(line)
             if match:
@@ -523,23 +626,25 @@ class CyberqDevice:
     def _parse_html(self, response: str) -> None:
         """Parse the HTML response."""
         _LOGGER.debug("Cyberq._parse_html")
+        prefix = self._PARSE_PREFIX
+        parse = self._PARSE_RE.match
+        accept = self._sensors.accept
         for line in response.split("\r\n"):
-            match = self._PARSE_VALUE_RE.match(line)
-            if match:
-                if match.group("value").startswith("TempHTMLToPIC"):
-                    continue
-                self._sensors.accept(
-                    match.group("key"), match.group("value").strip('"')
-                )
-                _LOGGER.debug(
-                    "Cyberq._parse_html %s=%s",
-                    match.group("key"),
-                    match.group("value").strip('"'),
-                )
+            if prefix not in line:
                 continue
-            match = self._PARSE_TEMP_RE.match(line)
-            if match:
-                self._sensors.accept(match.group("key"), match.group("value"))
+            match = parse(line)
+            if not match:
+                continue
+            key = match.group("key")
+            if key is None:
+                accept(match.group("temp_key"), match.group("temp_value"))
+                continue
+            value = match.group("value")
+            if value.startswith("TempHTMLToPIC"):
+                continue
+            value = value.strip('"')
+            accept(key, value)
+            _LOGGER.debug("Cyberq._parse_html %s=%s", key, value)
         _LOGGER.debug("Cyberq._parse_html done")
 
     async def _config(self, response: str | None = None) -> None:
@@ -556,95 +661,86 @@ class CyberqDevice:
             if not xml_config:
                 xml_config = await self._get(self._config_xml)
             for key, value in xmltodict.parse(xml_config)["nutcallstatus"].items():
-                if key in ["COOK", "FOOD1", "FOOD2", "FOOD3"]:
-                    for value_key in (f"{key}_NAME", f"{key}_SET"):
-                        self._sensors.accept(value_key, value[value_key])
-                    continue
-                if key == "WIFI":
+                section_keys = _CONFIG_SECTION_KEYS.get(key)
+                if section_keys is not None:
+                    self._sensors.accept_batch(
+                        (value_key, value[value_key]) for value_key in section_keys
+                    )
+                elif key == "WIFI":
                     self.mac = value["MAC"]
                     self.serial_number = "".join(self.mac.split(":")[4:6])
-                    continue
-                if key == "FWVER":
+                elif key == "FWVER":
                     self.sw_version = value
-                    continue
-                if key == "CONTROL":
-                    for value_key in (
-                        "TIMEOUT_ACTION",
-                        "COOKHOLD",
-                        "ALARMDEV",
-                        "OPENDETECT",
-                    ):
-                        self._sensors.accept(value_key, value[value_key])
-                    continue
-                if key == "SYSTEM":
-                    for value_key in (
-                        "MENU_SCROLLING",
-                        "LCD_BACKLIGHT",
-                        "LCD_CONTRAST",
-                        "ALARM_BEEPS",
-                        "KEY_BEEPS",
-                    ):
-                        self._sensors.accept(value_key, value[value_key])
-                    continue
             return
 
         if response is None:
             _LOGGER.debug("%s _config", self.serial_number)
-            for page in ("control.htm", "index.htm", "system.htm"):
-                _LOGGER.debug(
-                    "Cyberq._config: reading %s (%s)",
-                    page,
-                    urllib.parse.urljoin(self._base_url, page),
-                )
-                self._parse_html(
-                    await self._get(urllib.parse.urljoin(self._base_url, page))
-                )
-                _LOGGER.debug("Cyberq._config: done %s", page)
+            pages = (Page.CONTROL, Page.INDEX, Page.SYSTEM)
+            # The pages are independent, fetch them concurrently
+            responses = await asyncio.gather(
+                *(self._get(self._page_urls[page]) for page in pages)
+            )
+            # Parsing updates self._sensors so it stays sequential
+            for page, page_response in zip(pages, responses, strict=True):
+                _LOGGER.debug("Cyberq._config: parsing %s", page)
+                self._parse_html(page_response)
         else:
             # Response was provided
             _LOGGER.debug("%s _config w/response", self.serial_number)
             self._parse_html(response)
 
-        self._last_config = datetime.datetime.now(tz=datetime.UTC)
-
     async def async_set(self, key: str, value: Any) -> bool:
         """Set a value from user input."""
         _LOGGER.debug("Setting %s %s", key, value)
-        sensor = getattr(self._sensors, key)
-        _value = sensor.export(value)
+        sensor = CYBERQ_SENSORS[key]
+        _value = sensor.export(value)  # type: ignore[attr-defined]
         _key = sensor.alias if self.cyberq_cloud and sensor.alias is not None else key
 
         _LOGGER.warning("Cyberq.async_set(%s, %s)", _key, _value)
 
-        response = await self._post(
-            urllib.parse.urljoin(self._base_url, sensor.page), data={_key: _value}
-        )
-        await self._config(response)
+        async with self._lock:
+            # Don't change the sensors already returned by async_update
+            self._sensors = self._sensors.copy()
+            response = await self._post(
+                self._page_urls[sensor.page], data={_key: _value}
+            )
+            # Report the new value right away, values read below take precedence
+            self._sensors.set_local(key, value)
+            # Parse the next status even if it has not changed
+            self._last_status = None
+            await self._config(response)
 
         return True
 
     async def async_update(self) -> CyberqSensors:
         """Refresh the data."""
-        self._sensors = copy.deepcopy(self._sensors)
-
-        # Read config every 10 minutes
-        if self._last_config is None or self._last_config + datetime.timedelta(
-            minutes=10
-        ) < datetime.datetime.now(tz=datetime.UTC):
-            await self._config()
-
-        response = await self._get(self._status_url)
-
-        for key, value in xmltodict.parse(response)["nutcstatus"].items():
-            if key == "comment":
-                continue
-            self._sensors.accept(key, value)
+        async with self._lock:
+            # Values are updated in place, so leave the previous result untouched
+            self._sensors = self._sensors.copy()
+
+            # Read config every 10 minutes
+            now = time.monotonic()
+            if now >= self._next_config_at:
+                await self._config()
+                self._next_config_at = now + CYBERQ_CONFIG_INTERVAL
+                # Status values take precedence over the config just read
+                self._last_status = None
+
+            response = await self._get(self._status_url)
+
+            # Skip parsing if the status has not changed since the last poll
+            if response != self._last_status:
+                self._sensors.accept_batch(
+                    (element.tag, element.text or "")
+                    for element in ET.fromstring(response)  # noqa: S314
+                    if element.tag != "comment"
+                )
+                self._last_status = response
 
-        return self._sensors
+            return self._sensors
 
     def _valid_name(self, name: str) -> bool:
-        match = self._NAME_RE.match(name)
-        return match is not None
+        return name != "" and all(char.isalnum() or char in "_ " for char in name)
 
     def _valid_temp(self, temp: str) -> bool:
         try:
@@ -770,10 +866,22 @@ if __name__ == "__main__":
         """Test function."""
         options = parse_args()
 
+        # Keep the connection to the controller open between requests
+        connector = aiohttp.TCPConnector(
+            limit_per_host=2,
+            force_close=False,
+            enable_cleanup_closed=True,
+            keepalive_timeout=60,
+        )
         async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=10)
+            connector=connector, timeout=aiohttp.ClientTimeout(total=10)
         ) as session:
-            cyberq = CyberqDevice(options.host, port=options.port, session=session)
+            cyberq = CyberqDevice(
+                options.host,
+                port=options.port,
+                session=session,
+                headers={"Connection": "keep-alive"},
+            )
             await cyberq.async_update()
 
             if options.settings:
@@ -32,7 +32,6 @@ from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.core import HomeAssistant
 
 from . import CyberqConfigEntry
-from .cyberq import CyberqSensor
 
 TO_REDACT = {
     "serial_number",
@@ -50,15 +49,14 @@ async def async_get_config_entry_diagnostics(
     """Return diagnostics for a config entry."""
     cyberq = config_entry.runtime_data.cyberq
 
-    _excluded_keys = set(CyberqSensor.__dict__.keys())
-
     sensors = {
         sensor_name: {
-            key: value
-            for (key, value) in sensor.__dict__.items()
-            if key not in _excluded_keys
+            field.lstrip("_"): getattr(source, field)
+            for source in (state.sensor, state)
+            for field in source.DIAG_FIELDS
+            if hasattr(source, field)
         }
-        for sensor_name, sensor in cyberq.sensors.sensors.items()
+        for sensor_name, state in cyberq.sensors.sensors.items()
     }
 
     data = {
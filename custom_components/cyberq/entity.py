@@ -0,0 +1,72 @@
+"""
+Base entities for the CyberQ integration.
+
+MIT License
+
+Copyright (c) 2024 Jeffrey C Honig
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from abc import abstractmethod
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import CyberqDataUpdateCoordinator
+
+
+class CyberqValueEntity(CoordinatorEntity[CyberqDataUpdateCoordinator]):
+    """Base for entities that show a single CyberQ setting."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _last_state: tuple | None = None
+
+    def __init__(
+        self, coordinator: CyberqDataUpdateCoordinator, cyberq_name_key: str
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._attr_device_info = coordinator.device_info
+        self._cyberq_name_key = cyberq_name_key
+        self._set_value(self._get_value())
+
+    def _get_value(self) -> Any:
+        """Return the value from the coordinator data, None if not reported."""
+        sensor = self.coordinator.data.sensors.get(self._cyberq_name_key)
+        return None if sensor is None else sensor.value
+
+    @abstractmethod
+    def _set_value(self, value: Any) -> None:
+        """Store the value in the entity."""
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        value = self._get_value()
+        state = (self.available, value)
+        if state == self._last_state:
+            return
+        self._last_state = state
+        self._set_value(value)
+        self.async_write_ha_state()
@@ -27,24 +27,107 @@ SOFTWARE.
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
+from typing import Any
 
-from homeassistant.components.number import NumberDeviceClass, NumberEntity
+from homeassistant.components.number import (
+    NumberDeviceClass,
+    NumberEntity,
+    NumberEntityDescription,
+)
 from homeassistant.const import (
     PERCENTAGE,
     EntityCategory,
     UnitOfTemperature,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import CyberqConfigEntry, CyberqDataUpdateCoordinator
 from .cyberq import CYBERQ_SENSORS
+from .entity import CyberqValueEntity
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, kw_only=True)
+class CyberqNumberEntityDescription(NumberEntityDescription):
+    """A class that describes number entities."""
+
+    cyberq_name_key: str
+
+
+NUMBER_TYPES: tuple[CyberqNumberEntityDescription, ...] = (
+    CyberqNumberEntityDescription(
+        key="cook_propband",
+        translation_key="cook_propband",
+        icon="mdi:thermometer-lines",
+        cyberq_name_key="COOK_PROPBAND",
+        native_step=1,
+        device_class=NumberDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
+        entity_registry_enabled_default=False,
+    ),
+    CyberqNumberEntityDescription(
+        key="cook_cyctime",
+        translation_key="cook_cyctime",
+        icon="mdi:fan-clock",
+        cyberq_name_key="COOK_CYCTIME",
+        native_step=1,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        entity_registry_enabled_default=False,
+    ),
+    CyberqNumberEntityDescription(
+        key="alarmdev",
+        translation_key="alarmdev",
+        icon="mdi:thermometer-alert",
+        cyberq_name_key="ALARMDEV",
+        native_step=1,
+        device_class=NumberDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        entity_registry_enabled_default=False,
+    ),
+    CyberqNumberEntityDescription(
+        key="lcd_backlight",
+        translation_key="lcd_backlight",
+        icon="mdi:brightness-5",
+        cyberq_name_key="LCD_BACKLIGHT",
+        native_step=1,
+        native_unit_of_measurement=PERCENTAGE,
+        entity_registry_enabled_default=False,
+    ),
+    CyberqNumberEntityDescription(
+        key="lcd_contrast",
+        translation_key="lcd_contrast",
+        icon="mdi:brightness-6",
+        cyberq_name_key="LCD_CONTRAST",
+        native_step=1,
+        native_unit_of_measurement=PERCENTAGE,
+        entity_registry_enabled_default=False,
+    ),
+    CyberqNumberEntityDescription(
+        key="cook_hold",
+        translation_key="cook_hold",
+        icon="mdi:thermometer",
+        cyberq_name_key="COOKHOLD",
+        native_step=0.1,
+        device_class=NumberDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
+        entity_registry_enabled_default=False,
+    ),
+)
+
+# (min, max) of each number, from the sensor descriptions
+_NUMBER_LIMITS = {
+    description.cyberq_name_key: (
+        CYBERQ_SENSORS[description.cyberq_name_key].min_value,
+        CYBERQ_SENSORS[description.cyberq_name_key].max_value,
+    )
+    for description in NUMBER_TYPES
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: CyberqConfigEntry,
@@ -52,125 +135,39 @@ async def async_setup_entry(
 ) -> None:
     """Set up the demo number platform."""
     coordinator = entry.runtime_data
+    sensors = coordinator.data.sensors
     async_add_entities(
         [
-            CyberqNumber(
-                coordinator,
-                translation_key="cook_propband",
-                icon="mdi:thermometer-lines",
-                cyberq_name_key="COOK_PROPBAND",
-                step=1,
-                device_class=NumberDeviceClass.TEMPERATURE,
-                unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
-                disabled=True,
-            ),
-            CyberqNumber(
-                coordinator,
-                translation_key="cook_cyctime",
-                icon="mdi:fan-clock",
-                cyberq_name_key="COOK_CYCTIME",
-                step=1,
-                unit_of_measurement=UnitOfTime.SECONDS,
-                disabled=True,
-            ),
-            CyberqNumber(
-                coordinator,
-                translation_key="alarmdev",
-                icon="mdi:thermometer-alert",
-                cyberq_name_key="ALARMDEV",
-                step=1,
-                device_class=NumberDeviceClass.TEMPERATURE,
-                unit_of_measurement=UnitOfTime.SECONDS,
-                disabled=True,
-            ),
-            CyberqNumber(
-                coordinator,
-                translation_key="lcd_backlight",
-                icon="mdi:brightness-5",
-                cyberq_name_key="LCD_BACKLIGHT",
-                step=1,
-                unit_of_measurement=PERCENTAGE,
-                disabled=True,
-            ),
-            CyberqNumber(
-                coordinator,
-                translation_key="lcd_contrast",
-                icon="mdi:brightness-6",
-                cyberq_name_key="LCD_CONTRAST",
-                step=1,
-                unit_of_measurement=PERCENTAGE,
-                disabled=True,
-            ),
-            CyberqNumber(
-                coordinator,
-                translation_key="cook_hold",
-                icon="mdi:thermometer",
-                cyberq_name_key="COOKHOLD",
-                step=0.1,
-                device_class=NumberDeviceClass.TEMPERATURE,
-                unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
-                disabled=True,
-            ),
+            CyberqNumber(coordinator, description)
+            for description in NUMBER_TYPES
+            if description.cyberq_name_key in sensors
         ]
     )
 
 
-class CyberqNumber(CoordinatorEntity[CyberqDataUpdateCoordinator], NumberEntity):
+class CyberqNumber(CyberqValueEntity, NumberEntity):
     """Representation of a Cyberq temperature probe as a thermostat ."""
 
-    _attr_has_entity_name = True
-    _attr_should_poll = False
     _attr_entity_category = EntityCategory.CONFIG
+    entity_description: CyberqNumberEntityDescription
 
     def __init__(
         self,
         coordinator: CyberqDataUpdateCoordinator,
-        *,
-        icon: str,
-        cyberq_name_key: str,
-        step: float,
-        unit_of_measurement: str,
-        disabled: bool = False,
-        device_class: NumberDeviceClass | None = None,
-        translation_key: str | None = None,
+        description: CyberqNumberEntityDescription,
     ) -> None:
         """Initialize the number device."""
-        super().__init__(coordinator)
-        self._attr_device_info = coordinator.device_info
-
-        self._cyberq_name_key = cyberq_name_key
-        self._attr_device_class = device_class
-        self._attr_translation_key = translation_key
-        self._attr_icon = icon
-        self._attr_native_min_value = CYBERQ_SENSORS[self._cyberq_name_key].min_value
-        self._attr_native_max_value = CYBERQ_SENSORS[self._cyberq_name_key].max_value
-        self._attr_native_step = step
-        self._attr_native_unit_of_measurement = unit_of_measurement
-        self._attr_entity_registry_enabled_default = not disabled
-
-        try:
-            self._attr_native_value = getattr(
-                self.coordinator.data, self._cyberq_name_key
-            ).value
-        except AttributeError:
-            self._attr_native_value = None
-        self._attr_unique_id = (
-            f"{self.coordinator.device_info['name']}_{translation_key}"
-        )
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator.."""
-        try:
-            self._attr_native_value = getattr(
-                self.coordinator.data, self._cyberq_name_key
-            ).value
-        except AttributeError:
-            self._attr_native_value = None
-        self.async_write_ha_state()
+        super().__init__(coordinator, description.cyberq_name_key)
+        self.entity_description = description
+        self._attr_native_min_value, self._attr_native_max_value = _NUMBER_LIMITS[
+            description.cyberq_name_key
+        ]
+        self._attr_unique_id = f"{coordinator.device_name}_{description.key}"
+
+    def _set_value(self, value: Any) -> None:
+        """Store the value in the entity."""
+        self._attr_native_value = value
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new target temperature."""
-        await self.coordinator.cyberq.async_set(self._cyberq_name_key, value)
-        await self.coordinator.async_request_refresh()
-        self.async_write_ha_state()
+        await self.coordinator.async_set(self._cyberq_name_key, value)
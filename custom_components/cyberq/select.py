@@ -27,20 +27,67 @@ SOFTWARE.
 from __future__ import annotations
 
 import logging
-from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
 
-from homeassistant.components.select import SelectEntity
+from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import CyberqConfigEntry, CyberqDataUpdateCoordinator
 from .cyberq import CYBERQ_SENSORS
+from .entity import CyberqValueEntity
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, kw_only=True)
+class CyberqSelectEntityDescription(SelectEntityDescription):
+    """A class that describes select entities."""
+
+    cyberq_name_key: str
+
+
+SELECT_TYPES: tuple[CyberqSelectEntityDescription, ...] = (
+    CyberqSelectEntityDescription(
+        key="cook_ramp",
+        name="Ramp Probe",
+        translation_key="cook_ramp",
+        icon="mdi:thermometer-lines",
+        cyberq_name_key="COOK_RAMP",
+        options=CYBERQ_SENSORS["COOK_RAMP"].values,
+    ),
+    CyberqSelectEntityDescription(
+        key="deg_units",
+        name="Display degree units",
+        translation_key="deg_units",
+        icon="mdi:thermometer",
+        cyberq_name_key="DEG_UNITS",
+        options=CYBERQ_SENSORS["DEG_UNITS"].values,
+        entity_registry_enabled_default=False,
+    ),
+    CyberqSelectEntityDescription(
+        key="alarm_beeps",
+        name="Alarm beeps",
+        translation_key="alarm_beeps",
+        icon="mdi:alert",
+        cyberq_name_key="ALARM_BEEPS",
+        options=CYBERQ_SENSORS["ALARM_BEEPS"].values,
+        entity_registry_enabled_default=False,
+    ),
+    CyberqSelectEntityDescription(
+        key="timeout_action",
+        name="Timeout action",
+        translation_key="timeout_action",
+        icon="mdi:clock",
+        cyberq_name_key="TIMEOUT_ACTION",
+        options=CYBERQ_SENSORS["TIMEOUT_ACTION"].values,
+        entity_registry_enabled_default=False,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: CyberqConfigEntry,
@@ -48,102 +95,37 @@ async def async_setup_entry(
 ) -> None:
     """Set up the demo number platform."""
     coordinator = entry.runtime_data
+    sensors = coordinator.data.sensors
     async_add_entities(
         [
-            CyberqSelect(
-                coordinator,
-                key="Ramp Probe",
-                translation_key="cook_ramp",
-                icon="mdi:thermometer-lines",
-                cyberq_name_key="COOK_RAMP",
-                options=CYBERQ_SENSORS["COOK_RAMP"].values,
-            ),
-            CyberqSelect(
-                coordinator,
-                key="Display degree units",
-                translation_key="deg_units",
-                icon="mdi:thermometer",
-                cyberq_name_key="DEG_UNITS",
-                options=CYBERQ_SENSORS["DEG_UNITS"].values,
-                disabled=True,
-            ),
-            CyberqSelect(
-                coordinator,
-                key="Alarm beeps",
-                translation_key="alarm_beeps",
-                icon="mdi:alert",
-                cyberq_name_key="ALARM_BEEPS",
-                options=CYBERQ_SENSORS["ALARM_BEEPS"].values,
-                disabled=True,
-            ),
-            CyberqSelect(
-                coordinator,
-                key="Timeout action",
-                translation_key="timeout_action",
-                icon="mdi:clock",
-                cyberq_name_key="TIMEOUT_ACTION",
-                options=CYBERQ_SENSORS["TIMEOUT_ACTION"].values,
-                disabled=True,
-            ),
+            CyberqSelect(coordinator, description)
+            for description in SELECT_TYPES
+            if description.cyberq_name_key in sensors
         ]
     )
 
 
-class CyberqSelect(CoordinatorEntity[CyberqDataUpdateCoordinator], SelectEntity):
+class CyberqSelect(CyberqValueEntity, SelectEntity):
     """Representation of a Cyberq temperature probe as a thermostat ."""
 
-    _attr_has_entity_name = True
-    _attr_should_poll = False
     _attr_entity_category = EntityCategory.CONFIG
+    entity_description: CyberqSelectEntityDescription
 
     def __init__(
         self,
         coordinator: CyberqDataUpdateCoordinator,
-        *,
-        cyberq_name_key: str,
-        icon: str,
-        key: str,
-        translation_key: str,
-        options: list[str],
-        translation_placeholders: Mapping[str, str] | None = None,
-        disabled: bool = False,
+        description: CyberqSelectEntityDescription,
     ) -> None:
         """Initialize the selection device."""
-        super().__init__(coordinator)
-        self._attr_device_info = coordinator.device_info
-
-        self._cyberq_name_key = cyberq_name_key
-        self._attr_name = key
-        self._attr_translation_key = translation_key
-        if translation_placeholders is not None:
-            self._attr_translation_placeholders = translation_placeholders
-        self._attr_icon = icon
-        self._attr_options = options
-        self._attr_entity_registry_enabled_default = not disabled
-
-        try:
-            self._attr_current_option = getattr(
-                self.coordinator.data, self._cyberq_name_key
-            ).value
-        except AttributeError:
-            self._attr_current_option = None
-        self._attr_unique_id = (
-            f"{self.coordinator.device_info['name']}_{self.translation_key}"
-        )
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator.."""
-        try:
-            self._attr_current_option = getattr(
-                self.coordinator.data, self._cyberq_name_key
-            ).value
-        except AttributeError:
-            self._attr_current_option = None
-        self.async_write_ha_state()
+        super().__init__(coordinator, description.cyberq_name_key)
+        self.entity_description = description
+        self._attr_name = description.name
+        self._attr_unique_id = f"{coordinator.device_name}_{description.key}"
+
+    def _set_value(self, value: Any) -> None:
+        """Store the value in the entity."""
+        self._attr_current_option = value
 
     async def async_select_option(self, option: str) -> None:
         """Set new target temperature."""
-        await self.coordinator.cyberq.async_set(self._cyberq_name_key, option)
-        await self.coordinator.async_request_refresh()
-        self.async_write_ha_state()
+        await self.coordinator.async_set(self._cyberq_name_key, option)
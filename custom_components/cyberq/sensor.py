@@ -27,6 +27,7 @@ SOFTWARE.
 from __future__ import annotations
 
 import logging
+import operator
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
@@ -55,15 +56,25 @@ _LOGGER = logging.getLogger(__name__)
 class CyberqSensorEntityDescription(SensorEntityDescription):
     """A class that describes sensor entities."""
 
-    value: Callable[[CyberqSensors], StateType | datetime]
-    icon_fn: Callable[[CyberqSensors], str | None] | None = None
+    # Dotted attribute path of the value within CyberqSensors
+    value_path: str
+    # Sensor whose status index selects the icon
+    status_key: str | None = None
+
+    @property
+    def required_keys(self) -> frozenset[str]:
+        """Return the sensors the device must report for the entity."""
+        keys = {self.value_path.partition(".")[0]}
+        if self.status_key is not None:
+            keys.add(self.status_key)
+        return frozenset(keys)
 
 
 SENSOR_TYPES: tuple[CyberqSensorEntityDescription, ...] = (
     CyberqSensorEntityDescription(
         key="fan_speed",
         translation_key="fan_speed",
-        value=lambda data: data.OUTPUT_PERCENT.value,
+        value_path="OUTPUT_PERCENT.value",
         native_unit_of_measurement=PERCENTAGE,
         icon="mdi:fan",
     ),
@@ -71,17 +82,17 @@ SENSOR_TYPES: tuple[CyberqSensorEntityDescription, ...] = (
         key="pit_status",
         translation_key="cook_status",
         translation_placeholders={"cook_name": "Pit"},
-        value=lambda data: data.COOK_STATUS.value,
+        value_path="COOK_STATUS.value",
         device_class=SensorDeviceClass.ENUM,
         options=CYBERQ_SENSORS["COOK_STATUS"].values,
-        icon_fn=lambda data: STATUS_ICONS.get(data.COOK_STATUS.index),
+        status_key="COOK_STATUS",
     ),
     CyberqSensorEntityDescription(
         key="probe1_status",
         translation_key="cook_status",
         translation_placeholders={"cook_name": "Probe 1"},
-        value=lambda data: data.FOOD1_STATUS.value,
-        icon_fn=lambda data: STATUS_ICONS.get(data.FOOD1_STATUS.index),
+        value_path="FOOD1_STATUS.value",
+        status_key="FOOD1_STATUS",
         device_class=SensorDeviceClass.ENUM,
         options=CYBERQ_SENSORS["FOOD1_STATUS"].values,
     ),
@@ -89,16 +100,16 @@ SENSOR_TYPES: tuple[CyberqSensorEntityDescription, ...] = (
         key="probe2_status",
         translation_key="cook_status",
         translation_placeholders={"cook_name": "Probe 2"},
-        value=lambda data: data.FOOD2_STATUS.value,
-        icon_fn=lambda data: STATUS_ICONS.get(data.FOOD2_STATUS.index),
+        value_path="FOOD2_STATUS.value",
+        status_key="FOOD2_STATUS",
         device_class=SensorDeviceClass.ENUM,
         options=CYBERQ_SENSORS["FOOD2_STATUS"].values,
     ),
     CyberqSensorEntityDescription(
         key="probe3_status",
         translation_key="cook_status",
-        value=lambda data: data.FOOD3_STATUS.value,
-        icon_fn=lambda data: STATUS_ICONS.get(data.FOOD3_STATUS.index),
+        value_path="FOOD3_STATUS.value",
+        status_key="FOOD3_STATUS",
         translation_placeholders={"cook_name": "Probe 3"},
         device_class=SensorDeviceClass.ENUM,
         options=CYBERQ_SENSORS["FOOD3_STATUS"].values,
@@ -106,7 +117,7 @@ SENSOR_TYPES: tuple[CyberqSensorEntityDescription, ...] = (
     CyberqSensorEntityDescription(
         key="timer_status",
         translation_key="timer_status",
-        value=lambda data: data.TIMER_STATUS.value,
+        value_path="TIMER_STATUS.value",
         device_class=SensorDeviceClass.ENUM,
         options=CYBERQ_SENSORS["TIMER_STATUS"].values,
         entity_registry_enabled_default=False,
@@ -114,7 +125,7 @@ SENSOR_TYPES: tuple[CyberqSensorEntityDescription, ...] = (
     CyberqSensorEntityDescription(
         key="timer_curr",
         translation_key="timer_curr",
-        value=lambda data: data.TIMER_CURR.value,
+        value_path="TIMER_CURR.value",
         icon="mdi:timer",
         entity_registry_enabled_default=False,
     ),
@@ -128,40 +139,71 @@ async def async_setup_entry(
 ) -> None:
     """Add Cyberq entities from a config_entry."""
     coordinator = entry.runtime_data
-
-    async_add_entities(
-        CyberqSensor(coordinator, description)
+    device_name = coordinator.device_name
+    available_keys = frozenset(coordinator.data.sensors)
+
+    entities = [
+        CyberqSensor(
+            coordinator,
+            description,
+            entity_id=async_generate_entity_id(
+                ENTITY_ID_FORMAT, f"{device_name}_{description.key}", hass=hass
+            ),
+        )
         for description in SENSOR_TYPES
-        if description.value(coordinator.data) is not None
-    )
+        if available_keys.issuperset(description.required_keys)
+    ]
+    if entities:
+        async_add_entities(entities)
 
 
 class CyberqSensor(CoordinatorEntity[CyberqDataUpdateCoordinator], SensorEntity):
     """Define an Cyberq sensor."""
 
     _attr_has_entity_name = True
+    _last_state: tuple | None = None
+    _last_status_index: int | None = None
     entity_description: CyberqSensorEntityDescription
 
     def __init__(
         self,
         coordinator: CyberqDataUpdateCoordinator,
         description: CyberqSensorEntityDescription,
+        entity_id: str,
     ) -> None:
         """Initialize."""
         super().__init__(coordinator)
         self._attr_device_info = coordinator.device_info
-        self._attr_native_value = description.value(coordinator.data)
-        self._attr_icon = description.icon
-        self._attr_unique_id = f"{coordinator.device_info['name']}_{description.key}"
-        self.entity_id = async_generate_entity_id(
-            ENTITY_ID_FORMAT, self.unique_id, hass=coordinator.hass
+        self._value: Callable[[CyberqSensors], StateType | datetime] = (
+            operator.attrgetter(description.value_path)
         )
+        self._attr_native_value = self._value(coordinator.data)
+        self._attr_icon = description.icon
+        self._status_index: Callable[[CyberqSensors], int] | None = None
+        if description.status_key is not None:
+            self._status_index = operator.attrgetter(f"{description.status_key}.index")
+            self._update_icon(coordinator.data)
+        self._attr_unique_id = f"{coordinator.device_name}_{description.key}"
+        self.entity_id = entity_id
         self.entity_description = description
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self._attr_native_value = self.entity_description.value(self.coordinator.data)
-        if self.entity_description.icon_fn is not None:
-            self._attr_icon = self.entity_description.icon_fn(self.coordinator.data)
+        data = self.coordinator.data
+        value = self._value(data)
+        if self._status_index is not None:
+            self._update_icon(data)
+        state = (self.available, value, self._attr_icon)
+        if state == self._last_state:
+            return
+        self._last_state = state
+        self._attr_native_value = value
         self.async_write_ha_state()
+
+    def _update_icon(self, data: CyberqSensors) -> None:
+        """Set the icon for the status, unless the status is unchanged."""
+        index = self._status_index(data)  # type: ignore[misc]
+        if index != self._last_status_index:
+            self._last_status_index = index
+            self._attr_icon = STATUS_ICONS[index]
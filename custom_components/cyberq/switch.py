@@ -27,19 +27,55 @@ SOFTWARE.
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from typing import Any
 
-from homeassistant.components.switch import SwitchEntity
+from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import CyberqConfigEntry, CyberqDataUpdateCoordinator
+from .entity import CyberqValueEntity
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, kw_only=True)
+class CyberqSwitchEntityDescription(SwitchEntityDescription):
+    """A class that describes switch entities."""
+
+    cyberq_name_key: str
+
+
+SWITCH_TYPES: tuple[CyberqSwitchEntityDescription, ...] = (
+    CyberqSwitchEntityDescription(
+        key="Open Detect",
+        translation_key="opendetect",
+        icon="mdi:valve-open",
+        cyberq_name_key="OPENDETECT",
+        entity_category=EntityCategory.CONFIG,
+        entity_registry_enabled_default=False,
+    ),
+    CyberqSwitchEntityDescription(
+        key="Menu Scrolling",
+        translation_key="menu_scrolling",
+        icon="mdi:script-text",
+        cyberq_name_key="MENU_SCROLLING",
+        entity_category=EntityCategory.CONFIG,
+        entity_registry_enabled_default=False,
+    ),
+    CyberqSwitchEntityDescription(
+        key="Key Beeps",
+        translation_key="key_beeps",
+        icon="mdi:keyboard",
+        cyberq_name_key="KEY_BEEPS",
+        entity_category=EntityCategory.CONFIG,
+        entity_registry_enabled_default=False,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: CyberqConfigEntry,
@@ -47,88 +83,39 @@ async def async_setup_entry(
 ) -> None:
     """Add Cyberq entities from a config_entry."""
     coordinator = entry.runtime_data
+    sensors = coordinator.data.sensors
     async_add_entities(
         [
-            CyberqSwitch(
-                coordinator,
-                translation_key="opendetect",
-                key="Open Detect",
-                icon="mdi:valve-open",
-                cyberq_name_key="OPENDETECT",
-                entity_category=EntityCategory.CONFIG,
-                disabled=True,
-            ),
-            CyberqSwitch(
-                coordinator,
-                translation_key="menu_scrolling",
-                key="Menu Scrolling",
-                icon="mdi:script-text",
-                cyberq_name_key="MENU_SCROLLING",
-                entity_category=EntityCategory.CONFIG,
-                disabled=True,
-            ),
-            CyberqSwitch(
-                coordinator,
-                translation_key="key_beeps",
-                key="Key Beeps",
-                icon="mdi:keyboard",
-                cyberq_name_key="KEY_BEEPS",
-                entity_category=EntityCategory.CONFIG,
-                disabled=True,
-            ),
+            CyberqSwitch(coordinator, description)
+            for description in SWITCH_TYPES
+            if description.cyberq_name_key in sensors
         ]
     )
 
 
-class CyberqSwitch(CoordinatorEntity[CyberqDataUpdateCoordinator], SwitchEntity):
+class CyberqSwitch(CyberqValueEntity, SwitchEntity):
     """Define an Cyberq binary sensor."""
 
-    _attr_has_entity_name = True
-    _attr_native_value: bool
+    entity_description: CyberqSwitchEntityDescription
 
     def __init__(
         self,
         coordinator: CyberqDataUpdateCoordinator,
-        *,
-        key: str,
-        icon: str,
-        cyberq_name_key: str,
-        entity_category: EntityCategory,
-        disabled: bool = False,
-        translation_key: str | None = None,
+        description: CyberqSwitchEntityDescription,
     ) -> None:
         """Initialize."""
-        super().__init__(coordinator)
-        self._attr_device_info = coordinator.device_info
-
-        self._attr_translation_key = translation_key
-        self._attr_icon = icon
-        self._attr_unique_id = f"{coordinator.device_info['name']}_{key}"
-        self._cyberq_name_key = cyberq_name_key
-        self._attr_entity_category = entity_category
-        self._attr_available = hasattr(self.coordinator.data, self._cyberq_name_key)
-        self._attr_entity_registry_enabled_default = not disabled
-
-    @property
-    def is_on(self) -> bool:
-        """Return the state of the sensor."""
-        return self._attr_native_value
+        super().__init__(coordinator, description.cyberq_name_key)
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.device_name}_{description.key}"
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
-        await self.coordinator.cyberq.async_set(self._cyberq_name_key, 1)
+        await self.coordinator.async_set(self._cyberq_name_key, 1)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
-        await self.coordinator.cyberq.async_set(self._cyberq_name_key, 0)
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._attr_available = hasattr(self.coordinator.data, self._cyberq_name_key)
-        if not self._attr_available:
-            return
-        self._attr_native_value = getattr(
-            self.coordinator.data, self._cyberq_name_key
-        ).value
-        self.async_write_ha_state()
+        await self.coordinator.async_set(self._cyberq_name_key, 0)
+
+    def _set_value(self, value: Any) -> None:
+        """Store the value in the entity."""
+        self._attr_is_on = None if value is None else bool(value)